@@ -1,2 +1,3 @@
 from .api import API, PublicAPI
+from .async_base import AsyncSender
 from .base import Sender
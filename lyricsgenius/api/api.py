@@ -33,16 +33,42 @@ class API(Sender):
         access_token (:obj:`str`): API key provided by Genius.
         response_format (:obj:`str`, optional): API response format (dom, plain, html).
         timeout (:obj:`int`, optional): time before quitting on response (seconds).
-        sleep_time (:obj:`str`, optional): time to wait between requests.
-        retries (:obj:`int`, optional): Number of retries in case of timeouts and
-            errors with a >= 500 response code. By default, requests are only made once.
+        sleep_time (:obj:`str`, optional): minimum time to wait between
+            requests. Off (0) by default; requests only back off
+            reactively when Genius rate-limits or errors.
+        retries (:obj:`int`, optional): Number of retries in case of timeouts,
+            rate limits (429) and errors with a >= 500 response code.
+            Waits for the server's Retry-After when given, otherwise
+            backs off exponentially. Defaults to 3.
+        pool_maxsize (:obj:`int`, optional): Maximum size of the connection
+            pool kept per host. Raise it to match your thread count when
+            making concurrent requests. Defaults to 32.
+        cache (:obj:`str` | :obj:`bool`, optional): Directory to cache GET
+            responses in. Pass `True` to cache in a temporary directory.
+            Off by default. Uses diskcache when installed, otherwise an
+            in-memory fallback.
+        cache_ttl (:obj:`int`, optional): Seconds before cached responses
+            expire. Defaults to one week.
 
     Attributes:
         response_format (:obj:`str`, optional): API response format (dom, plain, html).
         timeout (:obj:`int`, optional): time before quitting on response (seconds).
-        sleep_time (:obj:`str`, optional): time to wait between requests.
-        retries (:obj:`int`, optional): Number of retries in case of timeouts and
-            errors with a >= 500 response code. By default, requests are only made once.
+        sleep_time (:obj:`str`, optional): minimum time to wait between
+            requests. Off (0) by default; requests only back off
+            reactively when Genius rate-limits or errors.
+        retries (:obj:`int`, optional): Number of retries in case of timeouts,
+            rate limits (429) and errors with a >= 500 response code.
+            Waits for the server's Retry-After when given, otherwise
+            backs off exponentially. Defaults to 3.
+        pool_maxsize (:obj:`int`, optional): Maximum size of the connection
+            pool kept per host. Raise it to match your thread count when
+            making concurrent requests. Defaults to 32.
+        cache (:obj:`str` | :obj:`bool`, optional): Directory to cache GET
+            responses in. Pass `True` to cache in a temporary directory.
+            Off by default. Uses diskcache when installed, otherwise an
+            in-memory fallback.
+        cache_ttl (:obj:`int`, optional): Seconds before cached responses
+            expire. Defaults to one week.
 
     Returns:
         :class:`API`: An object of the `API` class.
@@ -53,8 +79,11 @@ class API(Sender):
                  access_token,
                  response_format='plain',
                  timeout=5,
-                 sleep_time=0.2,
-                 retries=0,
+                 sleep_time=0,
+                 retries=3,
+                 pool_maxsize=32,
+                 cache=None,
+                 cache_ttl=7 * 86400,
                  ):
         super().__init__(
             access_token=access_token,
@@ -62,6 +91,9 @@ class API(Sender):
             timeout=timeout,
             sleep_time=sleep_time,
             retries=retries,
+            pool_maxsize=pool_maxsize,
+            cache=cache,
+            cache_ttl=cache_ttl,
         )
 
     def account(self, text_format=None):
@@ -502,16 +534,42 @@ class PublicAPI(
     Args:
         response_format (:obj:`str`, optional): API response format (dom, plain, html).
         timeout (:obj:`int`, optional): time before quitting on response (seconds).
-        sleep_time (:obj:`str`, optional): time to wait between requests.
-        retries (:obj:`int`, optional): Number of retries in case of timeouts and
-            errors with a >= 500 response code. By default, requests are only made once.
+        sleep_time (:obj:`str`, optional): minimum time to wait between
+            requests. Off (0) by default; requests only back off
+            reactively when Genius rate-limits or errors.
+        retries (:obj:`int`, optional): Number of retries in case of timeouts,
+            rate limits (429) and errors with a >= 500 response code.
+            Waits for the server's Retry-After when given, otherwise
+            backs off exponentially. Defaults to 3.
+        pool_maxsize (:obj:`int`, optional): Maximum size of the connection
+            pool kept per host. Raise it to match your thread count when
+            making concurrent requests. Defaults to 32.
+        cache (:obj:`str` | :obj:`bool`, optional): Directory to cache GET
+            responses in. Pass `True` to cache in a temporary directory.
+            Off by default. Uses diskcache when installed, otherwise an
+            in-memory fallback.
+        cache_ttl (:obj:`int`, optional): Seconds before cached responses
+            expire. Defaults to one week.
 
     Attributes:
         response_format (:obj:`str`, optional): API response format (dom, plain, html).
         timeout (:obj:`int`, optional): time before quitting on response (seconds).
-        sleep_time (:obj:`str`, optional): time to wait between requests.
-        retries (:obj:`int`, optional): Number of retries in case of timeouts and
-            errors with a >= 500 response code. By default, requests are only made once.
+        sleep_time (:obj:`str`, optional): minimum time to wait between
+            requests. Off (0) by default; requests only back off
+            reactively when Genius rate-limits or errors.
+        retries (:obj:`int`, optional): Number of retries in case of timeouts,
+            rate limits (429) and errors with a >= 500 response code.
+            Waits for the server's Retry-After when given, otherwise
+            backs off exponentially. Defaults to 3.
+        pool_maxsize (:obj:`int`, optional): Maximum size of the connection
+            pool kept per host. Raise it to match your thread count when
+            making concurrent requests. Defaults to 32.
+        cache (:obj:`str` | :obj:`bool`, optional): Directory to cache GET
+            responses in. Pass `True` to cache in a temporary directory.
+            Off by default. Uses diskcache when installed, otherwise an
+            in-memory fallback.
+        cache_ttl (:obj:`int`, optional): Seconds before cached responses
+            expire. Defaults to one week.
 
     Returns:
         :class:`PublicAPI`: An object of the `PublicAPI` class.
@@ -522,8 +580,11 @@ class PublicAPI(
         self,
         response_format='plain',
         timeout=5,
-        sleep_time=0.2,
-        retries=0,
+        sleep_time=0,
+        retries=3,
+        pool_maxsize=32,
+        cache=None,
+        cache_ttl=7 * 86400,
         **kwargs
     ):
         # Genius PublicAPI Constructor
@@ -532,5 +593,8 @@ class PublicAPI(
             timeout=timeout,
             sleep_time=sleep_time,
             retries=retries,
+            pool_maxsize=pool_maxsize,
+            cache=cache,
+            cache_ttl=cache_ttl,
             **kwargs
         )
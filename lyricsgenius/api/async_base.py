@@ -0,0 +1,195 @@
+import asyncio
+import os
+
+from requests.exceptions import HTTPError, Timeout
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from .base import Sender, get_description, get_retry_delay
+
+
+class AsyncSender(object):
+    """Sends asynchronous requests to Genius.
+
+    Mirrors :class:`Sender`, but issues requests through an
+    ``httpx.AsyncClient`` with HTTP/2 enabled, so a batch of calls can
+    run concurrently over a single multiplexed connection. Requires the
+    optional ``httpx`` dependency (``pip install httpx[http2]``).
+
+    For API compatibility with the synchronous client, failed requests
+    raise the same :obj:`requests.exceptions.HTTPError` and
+    :obj:`requests.exceptions.Timeout` exceptions as :class:`Sender`.
+    """
+    API_ROOT = Sender.API_ROOT
+    PUBLIC_API_ROOT = Sender.PUBLIC_API_ROOT
+    WEB_ROOT = Sender.WEB_ROOT
+
+    def __init__(
+        self,
+        access_token=None,
+        response_format='plain',
+        timeout=5,
+        sleep_time=0,
+        retries=3,
+        max_concurrency=10
+    ):
+        if httpx is None:
+            raise ImportError("httpx is required for AsyncSender. "
+                              "Install it using `pip install httpx[http2]`.")
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=timeout,
+            headers={
+                'application': 'LyricsGenius',
+                'User-Agent': 'https://github.com/johnwmillr/LyricsGenius'
+            },
+            limits=httpx.Limits(max_connections=max_concurrency,
+                                max_keepalive_connections=max_concurrency)
+        )
+        if access_token is None:
+            access_token = os.environ.get('GENIUS_ACCESS_TOKEN')
+        self.access_token = 'Bearer ' + access_token if access_token else None
+        self.authorization_header = {'authorization': self.access_token}
+        self.response_format = response_format.lower()
+        self.timeout = timeout
+        self.sleep_time = sleep_time
+        self.retries = retries
+        self.max_concurrency = max_concurrency
+
+    async def _make_request(
+        self,
+        path,
+        method='GET',
+        params_=None,
+        public_api=False,
+        web=False,
+        **kwargs
+    ):
+        """Makes an asynchronous request to Genius."""
+        if public_api:
+            uri = self.PUBLIC_API_ROOT
+            header = None
+        elif web:
+            uri = self.WEB_ROOT
+            header = None
+        else:
+            uri = self.API_ROOT
+            header = self.authorization_header
+        uri += path
+
+        params_ = params_ if params_ else {}
+
+        # Make the request
+        response = None
+        tries = 0
+        while response is None and tries <= self.retries:
+            tries += 1
+            try:
+                response = await self._client.request(method, uri,
+                                                      timeout=self.timeout,
+                                                      params=params_,
+                                                      headers=header,
+                                                      **kwargs)
+                response.raise_for_status()
+            except httpx.TimeoutException as e:
+                error = "Request timed out:\n{e}".format(e=e)
+                if tries > self.retries:
+                    raise Timeout(error)
+            except httpx.HTTPStatusError as e:
+                error = get_description(e)
+                status_code = e.response.status_code
+                if ((status_code != 429 and status_code < 500)
+                        or tries > self.retries):
+                    raise HTTPError(status_code, error)
+                # Rate-limited or server error; back off before retrying
+                await asyncio.sleep(get_retry_delay(e.response, tries))
+                response = None
+                continue
+
+            # Enforce the optional rate-limiting floor
+            if self.sleep_time:
+                await asyncio.sleep(self.sleep_time)
+
+        if web:
+            return response.text
+        elif response.status_code == 200:
+            res = response.json()
+            return res.get("response", res)
+        elif response.status_code == 204:
+            return 204
+        else:
+            raise AssertionError("Response status code was neither 200, nor 204! "
+                                 "It was {}".format(response.status_code))
+
+    async def _make_requests(
+        self,
+        paths,
+        method='GET',
+        params_=None,
+        public_api=False,
+        web=False,
+        **kwargs
+    ):
+        """Makes several requests concurrently.
+
+        Requests run under ``asyncio.gather``, with concurrency bounded
+        by :attr:`max_concurrency`. Results are returned in the order of
+        :obj:`paths`.
+        """
+        # Created here rather than in __init__ so the semaphore always
+        # binds the loop this batch runs under
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(path):
+            async with semaphore:
+                return await self._make_request(path, method=method,
+                                                params_=params_,
+                                                public_api=public_api,
+                                                web=web, **kwargs)
+
+        return await asyncio.gather(*(fetch(path) for path in paths))
+
+    async def song(self, song_id, text_format=None):
+        """Gets data for a specific song.
+
+        Args:
+            song_id (:obj:`int`): Genius song ID
+            text_format (:obj:`str`, optional): Text format of the results
+                ('dom', 'html', 'markdown' or 'plain').
+
+        Returns:
+            :obj:`dict`
+
+        """
+        endpoint = "songs/{id}".format(id=song_id)
+        params = {'text_format': text_format or self.response_format}
+        return await self._make_request(endpoint, params_=params)
+
+    async def songs(self, song_ids, text_format=None):
+        """Gets data for several songs concurrently.
+
+        Args:
+            song_ids (:obj:`list`): Genius song IDs.
+            text_format (:obj:`str`, optional): Text format of the results
+                ('dom', 'html', 'markdown' or 'plain').
+
+        Returns:
+            :obj:`list`: Song data, in the order of :obj:`song_ids`.
+
+        Examples:
+            .. code:: python
+
+                sender = AsyncSender(token)
+                songs = asyncio.run(sender.songs([2857381, 378195]))
+
+        """
+        paths = ["songs/{id}".format(id=song_id) for song_id in song_ids]
+        params = {'text_format': text_format or self.response_format}
+        return await self._make_requests(paths, params_=params)
+
+    async def aclose(self):
+        """Closes the underlying HTTP client."""
+        await self._client.aclose()
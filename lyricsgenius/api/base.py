@@ -1,8 +1,15 @@
+import hashlib
+import random
 import time
 import os
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, Timeout
+from urllib3.util import Retry
 
 
 class Sender(object):
@@ -12,19 +19,49 @@ class Sender(object):
     PUBLIC_API_ROOT = 'https://genius.com/api/'
     WEB_ROOT = 'https://genius.com/'
 
+    # Base delay (seconds) of the exponential backoff used when the
+    # server doesn't supply a Retry-After header.
+    BACKOFF_BASE = 0.5
+
     def __init__(
         self,
         access_token=None,
         response_format='plain',
         timeout=5,
-        sleep_time=0.2,
-        retries=0
+        sleep_time=0,
+        retries=3,
+        pool_maxsize=32,
+        cache=None,
+        cache_ttl=7 * 86400
     ):
         self._session = requests.Session()
-        self._session.headers = {
+        # Only the static headers live on the session; authorization is
+        # passed per-request so the session state is never mutated.
+        self._session.headers.update({
             'application': 'LyricsGenius',
             'User-Agent': 'https://github.com/johnwmillr/LyricsGenius'
-        }
+        })
+        # Retry rate limits and server errors inside urllib3, honoring
+        # the Retry-After header, and size the connection pool for
+        # threaded use so keep-alive connections aren't discarded.
+        # Read timeouts are excluded (read=False) so they surface as
+        # requests' Timeout instead of a wrapped ConnectionError;
+        # _make_request retries them itself.
+        retry_strategy = Retry(
+            total=retries,
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        # One adapter per host to keep the pools isolated
+        for prefix in (self.API_ROOT, self.WEB_ROOT):
+            self._session.mount(prefix,
+                                HTTPAdapter(pool_connections=1,
+                                            pool_maxsize=pool_maxsize,
+                                            max_retries=retry_strategy))
         if access_token is None:
             access_token = os.environ.get('GENIUS_ACCESS_TOKEN')
         self.access_token = 'Bearer ' + access_token if access_token else None
@@ -33,6 +70,19 @@ class Sender(object):
         self.timeout = timeout
         self.sleep_time = sleep_time
         self.retries = retries
+        self.cache_ttl = cache_ttl
+        if cache:
+            try:
+                import diskcache
+            except ImportError:
+                diskcache = None
+            if diskcache is not None:
+                directory = cache if isinstance(cache, str) else None
+                self._cache = diskcache.Cache(directory)
+            else:
+                self._cache = _MemoryCache()
+        else:
+            self._cache = None
 
     def _make_request(
         self,
@@ -57,7 +107,22 @@ class Sender(object):
 
         params_ = params_ if params_ else {}
 
-        # Make the request
+        # Serve idempotent requests from the cache when possible.
+        # The account endpoint is identity-bound, so never cache it.
+        key = None
+        if (self._cache is not None and method == 'GET'
+                and not path.startswith('account')):
+            key = hashlib.blake2b(
+                repr((public_api, web, path,
+                      sorted(params_.items()))).encode()).hexdigest()
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        # Make the request. Rate limits (429), server errors and
+        # connection failures are retried by the mounted adapter, which
+        # backs off and honors Retry-After before the response ever
+        # reaches this frame; timeouts are retried here.
         response = None
         tries = 0
         while response is None and tries <= self.retries:
@@ -75,23 +140,82 @@ class Sender(object):
                     raise Timeout(error)
             except HTTPError as e:
                 error = get_description(e)
-                if response.status_code < 500 or tries > self.retries:
-                    raise HTTPError(response.status_code, error)
+                raise HTTPError(e.response.status_code, error)
 
-            # Enforce rate limiting
+        # Enforce the optional rate-limiting floor
+        if self.sleep_time:
             time.sleep(self.sleep_time)
 
         if web:
-            return response.text
+            res = response.text
         elif response.status_code == 200:
             res = response.json()
-            return res.get("response", res)
+            res = res.get("response", res)
         elif response.status_code == 204:
+            # 204 responses carry no body and aren't worth caching
             return 204
         else:
             raise AssertionError("Response status code was neither 200, nor 204! "
                                  "It was {}".format(response.status_code))
 
+        if key is not None:
+            self._cache.set(key, res, expire=self.cache_ttl)
+        return res
+
+
+class _MemoryCache(object):
+    """Minimal in-process LRU stand-in for diskcache.Cache.
+
+    Used when the optional diskcache dependency isn't installed.
+    Implements just the get/set subset :class:`Sender` relies on and
+    evicts the least recently used entry once maxsize is reached, so
+    bulk scrapes can't grow the process without bound.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        item = self._data.get(key)
+        if item is None:
+            return default
+        value, expires = item
+        if expires is not None and time.time() > expires:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value, expire=None):
+        expires = time.time() + expire if expire else None
+        self._data[key] = (value, expires)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+def get_retry_delay(response, tries):
+    """Returns how long to wait before retrying a failed request.
+
+    Honors the Retry-After header (a number of seconds or an HTTP-date)
+    if the server sent one, and otherwise falls back to exponential
+    backoff with a small random jitter.
+    """
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is not None:
+        try:
+            return max(float(retry_after), 0)
+        except ValueError:
+            pass
+        try:
+            date = parsedate_to_datetime(retry_after)
+            return max((date - datetime.now(timezone.utc)).total_seconds(), 0)
+        except (TypeError, ValueError):
+            pass
+    base = Sender.BACKOFF_BASE
+    return base * 2 ** (tries - 1) + random.uniform(0, 0.1 * base)
+
 
 def get_description(e):
     error = str(e)
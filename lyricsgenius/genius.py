@@ -25,7 +25,9 @@ class Genius(API, PublicAPI):
         access_token (:obj:`str`, optional): API key provided by Genius.
         response_format (:obj:`str`, optional): API response format (dom, plain, html).
         timeout (:obj:`int`, optional): time before quitting on response (seconds).
-        sleep_time (:obj:`str`, optional): time to wait between requests.
+        sleep_time (:obj:`str`, optional): minimum time to wait between
+            requests. Off (0) by default; requests only back off
+            reactively when Genius rate-limits or errors.
         verbose (:obj:`bool`, optional): Turn printed messages on or off.
         remove_section_headers (:obj:`bool`, optional): If `True`, removes [Chorus],
             [Bridge], etc. headers from lyrics.
@@ -35,8 +37,19 @@ class Genius(API, PublicAPI):
             as non-lyrics.
         replace_default_terms (:obj:`list`, optional): if True, replaces default
             excluded terms with user's. Default excluded terms are listed below.
-        retries (:obj:`int`, optional): Number of retries in case of timeouts and
-            errors with a >= 500 response code. By default, requests are only made once.
+        retries (:obj:`int`, optional): Number of retries in case of timeouts,
+            rate limits (429) and errors with a >= 500 response code.
+            Waits for the server's Retry-After when given, otherwise
+            backs off exponentially. Defaults to 3.
+        pool_maxsize (:obj:`int`, optional): Maximum size of the connection
+            pool kept per host. Raise it to match your thread count when
+            making concurrent requests. Defaults to 32.
+        cache (:obj:`str` | :obj:`bool`, optional): Directory to cache GET
+            responses in. Pass `True` to cache in a temporary directory.
+            Off by default. Uses diskcache when installed, otherwise an
+            in-memory fallback.
+        cache_ttl (:obj:`int`, optional): Seconds before cached responses
+            expire. Defaults to one week.
 
     Attributes:
         verbose (:obj:`bool`, optional): Turn printed messages on or off.
@@ -48,8 +61,19 @@ class Genius(API, PublicAPI):
             as non-lyrics.
         replace_default_terms (:obj:`list`, optional): if True, replaces default
             excluded terms with user's.
-        retries (:obj:`int`, optional): Number of retries in case of timeouts and
-            errors with a >= 500 response code. By default, requests are only made once.
+        retries (:obj:`int`, optional): Number of retries in case of timeouts,
+            rate limits (429) and errors with a >= 500 response code.
+            Waits for the server's Retry-After when given, otherwise
+            backs off exponentially. Defaults to 3.
+        pool_maxsize (:obj:`int`, optional): Maximum size of the connection
+            pool kept per host. Raise it to match your thread count when
+            making concurrent requests. Defaults to 32.
+        cache (:obj:`str` | :obj:`bool`, optional): Directory to cache GET
+            responses in. Pass `True` to cache in a temporary directory.
+            Off by default. Uses diskcache when installed, otherwise an
+            in-memory fallback.
+        cache_ttl (:obj:`int`, optional): Seconds before cached responses
+            expire. Defaults to one week.
 
     Returns:
         :class:`Genius`
@@ -67,11 +91,14 @@ class Genius(API, PublicAPI):
                      'instrumental', 'setlist']
 
     def __init__(self, access_token=None,
-                 response_format='plain', timeout=5, sleep_time=0.2,
+                 response_format='plain', timeout=5, sleep_time=0,
                  verbose=True, remove_section_headers=False,
                  skip_non_songs=True, excluded_terms=None,
                  replace_default_terms=False,
-                 retries=0,
+                 retries=3,
+                 pool_maxsize=32,
+                 cache=None,
+                 cache_ttl=7 * 86400,
                  ):
         # Genius Client Constructor
         super().__init__(
@@ -79,7 +106,10 @@ class Genius(API, PublicAPI):
             response_format=response_format,
             timeout=timeout,
             sleep_time=sleep_time,
-            retries=retries
+            retries=retries,
+            pool_maxsize=pool_maxsize,
+            cache=cache,
+            cache_ttl=cache_ttl
         )
 
         self.verbose = verbose
@@ -92,6 +122,8 @@ class Genius(API, PublicAPI):
         else:
             self.excluded_terms = self.default_terms.copy()
             self.excluded_terms.extend(excluded_terms)
+        self._excluded_terms_key = None
+        self._excluded_regex = None
 
     def lyrics(self, urlthing, remove_section_headers=False):
         """Uses BeautifulSoup to scrape song info off of a Genius song URL
@@ -169,10 +201,15 @@ class Genius(API, PublicAPI):
         if song['lyrics_state'] != 'complete':
             return False
 
-        expression = r"".join(["({})|".format(term) for term in self.excluded_terms])
-        expression = expression.strip('|')
-        regex = re.compile(expression, re.IGNORECASE)
-        return not regex.search(clean_str(song['title']))
+        # Rebuild the compiled pattern only when the excluded terms
+        # change; this method runs once per hit in batch searches.
+        terms = tuple(self.excluded_terms)
+        if terms != self._excluded_terms_key:
+            expression = r"".join(["({})|".format(term) for term in terms])
+            expression = expression.strip('|')
+            self._excluded_regex = re.compile(expression, re.IGNORECASE)
+            self._excluded_terms_key = terms
+        return not self._excluded_regex.search(clean_str(song['title']))
 
     def _get_item_from_search_response(self, response, search_term, type_, result_type):
         """Gets the desired item from the search results.
@@ -26,6 +26,12 @@ class Artist(BaseEntity):
 
     """
 
+    # Attributes copied verbatim from the response body
+    _BODY_KEYS = ('api_path', 'header_image_url', 'image_url',
+                  'is_meme_verified', 'is_verified', 'name', 'url')
+
+    __slots__ = ('songs', 'num_songs') + _BODY_KEYS
+
     def __init__(self, client, json_dict):
         # Artist Constructor
         body = json_dict
@@ -35,14 +41,8 @@ class Artist(BaseEntity):
         self.songs = []
         self.num_songs = len(self.songs)
 
-        self.api_path = body['api_path']
-        self.header_image_url = body['header_image_url']
-        self.image_url = body['image_url']
-        # self.iq = body['iq']
-        self.is_meme_verified = body['is_meme_verified']
-        self.is_verified = body['is_verified']
-        self.name = body['name']
-        self.url = body['url']
+        for key in self._BODY_KEYS:
+            setattr(self, key, body.get(key))
 
     def __len__(self):
         return len(self.songs)
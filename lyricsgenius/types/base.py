@@ -1,13 +1,24 @@
 import json
 import os
+import re
 from abc import ABC, abstractmethod
 
 from ..utils import safe_unicode, sanitize_filename
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Trailing extension (any case) stripped off user-supplied filenames
+_EXT_RE = re.compile(r'\.(?:txt|json)$', re.IGNORECASE)
+
 
 class BaseEntity(ABC):
     """Base class for types."""
 
+    __slots__ = ('id', '_body', '_client', '__weakref__')
+
     def __init__(self, id):
         self.id = id
 
@@ -49,11 +60,7 @@ class BaseEntity(ABC):
         assert (extension == 'json') or (extension == 'txt'), msg
 
         # Determine the filename
-        for ext in [".txt", ".TXT", ".json", ".JSON"]:
-            if ext in filename:
-                filename = filename.replace(ext, "")
-                break
-        filename += "." + extension
+        filename = _EXT_RE.sub("", filename) + "." + extension
         filename = sanitize_filename(filename) if sanitize else filename
 
         # Check if file already exists
@@ -111,9 +118,26 @@ class BaseEntity(ABC):
             If you set :obj:`sanitize` to `False`, the file name may contain
             invalid characters, and therefore cause the saving to fail.
 
+        Note:
+            If the optional orjson package is installed and
+            :obj:`ensure_ascii` is `False`, serialization is done by
+            orjson, which is several times faster on lyric-sized
+            payloads. orjson always emits UTF-8, so :obj:`ensure_ascii`
+            requests fall back to the standard library encoder.
+
         """
         data = self.to_dict()
 
+        if orjson is not None and not ensure_ascii:
+            serialized = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            if not filename:
+                return serialized.decode()
+            filename = sanitize_filename(filename) if sanitize else filename
+            # Write the UTF-8 bytes as-is; skips a decode/encode round trip
+            with open(filename, 'wb') as ff:
+                ff.write(serialized)
+            return None
+
         # Return the json string if no output path was specified
         if not filename:
             return json.dumps(data, indent=1, ensure_ascii=ensure_ascii)
@@ -162,9 +186,11 @@ class BaseEntity(ABC):
 
     def __repr__(self):
         name = self.__class__.__name__
-        attrs = [x
-                 for x in list(self.__dict__.keys())
-                 if not x.startswith('_')]
+        attrs = []
+        for klass in reversed(type(self).__mro__):
+            attrs.extend(vars(klass).get('__slots__', ()))
+        attrs.extend(getattr(self, '__dict__', ()))
+        attrs = [x for x in attrs if not x.startswith('_')]
         attrs = ', '.join(attrs[:2])
         return "{}({}, ...)".format(name, attrs)
 
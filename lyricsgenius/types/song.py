@@ -2,7 +2,7 @@
 # Copyright 2018 John W. Miller
 # See LICENSE for details.
 
-from filecmp import cmp
+import weakref
 
 from .base import BaseEntity, Stats
 from .artist import Artist
@@ -36,6 +36,19 @@ class Song(BaseEntity):
 
     """
 
+    # Attributes copied verbatim from the response body
+    _BODY_KEYS = ('annotation_count', 'api_path', 'full_title',
+                  'header_image_thumbnail_url', 'header_image_url',
+                  'lyrics_owner_id', 'lyrics_state', 'path', 'pyongs_count',
+                  'song_art_image_thumbnail_url', 'song_art_image_url',
+                  'title', 'title_with_featured', 'url')
+
+    __slots__ = ('artist', 'lyrics', 'primary_artist', 'stats') + _BODY_KEYS
+
+    # Primary artists shared between sibling songs (e.g. the tracks of
+    # an album); weak values, so the cache alone never keeps one alive
+    _artist_cache = weakref.WeakValueDictionary()
+
     def __init__(self, client, json_dict, lyrics=""):
         body = json_dict
         super().__init__(body['id'])
@@ -43,23 +56,16 @@ class Song(BaseEntity):
         self._client = client
         self.artist = body['primary_artist']['name']
         self.lyrics = lyrics if lyrics else ""
-        self.primary_artist = Artist(client, body['primary_artist'])
+        artist_id = body['primary_artist']['id']
+        primary_artist = Song._artist_cache.get(artist_id)
+        if primary_artist is None:
+            primary_artist = Artist(client, body['primary_artist'])
+            Song._artist_cache[artist_id] = primary_artist
+        self.primary_artist = primary_artist
         self.stats = Stats(body['stats'])
 
-        self.annotation_count = body['annotation_count']
-        self.api_path = body['api_path']
-        self.full_title = body['full_title']
-        self.header_image_thumbnail_url = body['header_image_thumbnail_url']
-        self.header_image_url = body['header_image_url']
-        self.lyrics_owner_id = body['lyrics_owner_id']
-        self.lyrics_state = body['lyrics_state']
-        self.path = body['path']
-        self.pyongs_count = body['pyongs_count']
-        self.song_art_image_thumbnail_url = body['song_art_image_thumbnail_url']
-        self.song_art_image_url = body['song_art_image_url']
-        self.title = body['title']
-        self.title_with_featured = body['title_with_featured']
-        self.url = body['url']
+        for key in self._BODY_KEYS:
+            setattr(self, key, body.get(key))
 
     def to_dict(self):
         body = super().to_dict()
@@ -119,7 +125,9 @@ class Song(BaseEntity):
         return '"{title}" by {artist}:\n    {lyrics}'.format(
             title=self.title, artist=self.artist, lyrics=lyr.replace('\n', '\n    '))
 
-    def __cmp__(self, other):
-        return (cmp(self.title, other.title)
-                and cmp(self.artist, other.artist)
-                and cmp(self.lyrics, other.lyrics))
+    def __eq__(self, other):
+        """Two songs are equal if they have the same Genius ID."""
+        return isinstance(other, Song) and self.id == other.id
+
+    def __hash__(self):
+        return hash(self.id)
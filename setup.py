@@ -25,6 +25,15 @@ with open(path.join(this_directory, 'README.md'), encoding='utf-8') as f:
     long_description = f.read()
 
 extras_require = {
+    'async': [
+        'httpx[http2]',
+    ],
+    'cache': [
+        'diskcache',
+    ],
+    'json': [
+        'orjson',
+    ],
     'docs': [
         'sphinx~=3.2',
         'sphinx-rtd-theme',
@@ -55,7 +64,8 @@ setup(
     packages=find_packages(exclude=['tests']),
     install_requires=[
         'beautifulsoup4>=4.6.0',
-        'requests>=2.20.0'
+        'requests>=2.20.0',
+        'urllib3>=1.26'
     ],
     extras_require=extras_require,
     entry_points={
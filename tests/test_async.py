@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+
+from requests.exceptions import HTTPError
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from lyricsgenius.api.async_base import AsyncSender
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncSender(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        print("\n---------------------\nSetting up AsyncSender tests...\n")
+
+    def make_sender(self, handler, **kwargs):
+        sender = AsyncSender(access_token='token', **kwargs)
+        sender._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler))
+        return sender
+
+    def test_songs_returned_in_order(self):
+        def handler(request):
+            song_id = int(request.url.path.split('/')[-1])
+            return httpx.Response(
+                200, json={'response': {'song': {'id': song_id}}})
+
+        sender = self.make_sender(handler, max_concurrency=2)
+        songs = asyncio.run(sender.songs([1, 2, 3]))
+        self.assertEqual([song['song']['id'] for song in songs], [1, 2, 3])
+
+    def test_rate_limit_is_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(1)
+            if len(calls) == 1:
+                return httpx.Response(
+                    429, headers={'Retry-After': '0'},
+                    json={'error_description': 'rate limited'})
+            return httpx.Response(200, json={'response': {'song': {'id': 1}}})
+
+        sender = self.make_sender(handler)
+        song = asyncio.run(sender.song(1))
+        self.assertEqual(song['song']['id'], 1)
+        self.assertEqual(len(calls), 2)
+
+    def test_http_error_handler(self):
+        def handler(request):
+            return httpx.Response(404, json={'meta': {'message': 'Not found'}})
+
+        sender = self.make_sender(handler)
+        status_code = None
+        try:
+            asyncio.run(sender.song(0))
+        except HTTPError as e:
+            status_code = e.args[0]
+
+        self.assertEqual(status_code, 404)